@@ -5,13 +5,14 @@ import tempfile
 from docx import Document
 from PIL import Image
 from PIL.Image import Image as ImageType
-from typing import cast
+from typing import Optional, cast
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import FileResponse
 
 from app.core.config import settings
 from app.services.database import delete_file_entry
+from app.services.text_store import delete_pages, get_page_count, read_pages
 
 router = APIRouter()
 
@@ -83,10 +84,38 @@ async def download_file(file_id: str):
             raise HTTPException(status_code=500, detail="Could not convert file to PDF.")
 
 
+@router.get("/api/documents/{file_id}/pages", summary="Get the extracted text of a page range")
+async def get_document_pages(
+    file_id: str,
+    start: int = Query(1, alias="from", ge=1),
+    end: Optional[int] = Query(None, alias="to", ge=1),
+):
+    """
+    Returns the extracted text of pages from..to (1-based, inclusive) from the
+    document's text store. Only the requested pages are read and decompressed.
+    """
+    page_count = get_page_count(file_id)
+    if page_count is None:
+        raise HTTPException(status_code=404, detail="Extracted text not found")
+
+    end = page_count if end is None else min(end, page_count)
+    if start > end:
+        raise HTTPException(status_code=400, detail=f"Invalid page range, document has {page_count} pages.")
+
+    pages = read_pages(file_id, start, end)
+    return {
+        "file_id": file_id,
+        "page_count": page_count,
+        "pages": [
+            {"page": start + i, "text": text} for i, text in enumerate(pages)
+        ],
+    }
+
+
 @router.delete("/api/documents/{file_id}", summary="Delete a document and its index")
 async def delete_document(file_id: str):
     """
-    Deletes an uploaded document, its associated FAISS index, and the database entry.
+    Deletes an uploaded document, its associated FAISS index, extracted text, and the database entry.
     """
     try:
         # Delete the file from the uploads directory
@@ -102,6 +131,9 @@ async def delete_document(file_id: str):
         if os.path.exists(index_file_path):
             os.remove(index_file_path)
 
+        # Delete the extracted text store
+        delete_pages(file_id)
+
         # Delete the database entry
         delete_file_entry(file_id)
 
@@ -1,5 +1,8 @@
+import asyncio
+import json
+import logging
 import os
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
@@ -9,36 +12,79 @@ from pydantic import BaseModel
 
 from app.core.config import settings
 from app.core.utils import log_timing
-from app.services.vector_db import load_faiss_index, merge_faiss_indexes
+from app.services.vector_db import (
+    batch_similarity_search,
+    load_faiss_index,
+    merge_faiss_indexes,
+)
 from dotenv import load_dotenv
 load_dotenv()
 router = APIRouter()
 
+# Define the prompt template
+prompt_template = PromptTemplate(
+    input_variables=["context", "question"],
+    template="""You are an expert AI assistant that provides answers based solely on the provided documents.
+    Answer the following question using ONLY the context provided below.
+    If the context does not contain enough information to answer the question, state that you cannot find the answer in the documents.
+    Do not make up any information.
+
+    Context:
+    {context}
+
+    Question: {question}
+
+    Provide a concise answer. Always give top 3 citations using the format [Source: doc_name, Page: page_number].
+    """
+)
+
 class QA_Request(BaseModel):
     query: str
-    scope: str 
-    doc_id: Optional[str] = None 
+    scope: str
+    doc_id: Optional[str] = None
 
-@router.post("/api/qa", summary="Answer a question based on documents")
-@log_timing
-async def answer_question(request: QA_Request):
+class QA_BatchRequest(BaseModel):
+    questions: List[str]
+    scope: str
+    doc_id: Optional[str] = None
+
+
+def load_scope_vector_store(scope: str, doc_id: Optional[str]):
+    """
+    Loads the vector store for the requested scope.
+    Returns a (vector_store, error_message) tuple; exactly one of them is set.
+    """
     index_dir = settings.FAISS_INDEX_DIR
-    if request.scope == "this_document":
-        if not request.doc_id:
-            return {"answer": "Please specify a document ID for 'this_document' scope."}
-        vector_store = load_faiss_index(index_dir, request.doc_id)
+    if scope == "this_document":
+        if not doc_id:
+            return None, "Please specify a document ID for 'this_document' scope."
+        vector_store = load_faiss_index(index_dir, doc_id)
         if not vector_store:
-            return {
-                "answer": "I don't have information on that document. Please try again."
-            }
-    elif request.scope == "all_documents":
+            return None, "I don't have information on that document. Please try again."
+    elif scope == "all_documents":
         vector_store = merge_faiss_indexes(index_dir)
         if not vector_store:
-            return {
-                "answer": "I don't have any documents to answer this question from."
-            }
+            return None, "I don't have any documents to answer this question from."
     else:
-        return {"answer": "Invalid scope provided."}
+        return None, "Invalid scope provided."
+    return vector_store, None
+
+
+def build_context(retrieved_docs):
+    return "\n".join(
+        [
+            f"Document: {doc.metadata['doc_name']}, Page: {doc.metadata['page']}\nContent: {doc.page_content}"
+            for doc in retrieved_docs
+        ]
+    )
+
+
+@router.post("/api/qa", summary="Answer a question based on documents")
+@log_timing
+async def answer_question(request: QA_Request):
+    vector_store, error = load_scope_vector_store(request.scope, request.doc_id)
+    if error:
+        return {"answer": error}
 
     retriever = vector_store.as_retriever(
         search_kwargs={"k": 10}
@@ -49,34 +95,69 @@ async def answer_question(request: QA_Request):
     llm = ChatGoogleGenerativeAI(
         model="gemini-1.5-flash"
     )
-    # Define the prompt template
-    prompt_template = PromptTemplate(
-        input_variables=["context", "question"],
-        template="""You are an expert AI assistant that provides answers based solely on the provided documents.
-        Answer the following question using ONLY the context provided below.
-        If the context does not contain enough information to answer the question, state that you cannot find the answer in the documents.
-        Do not make up any information.
-        
-        Context:
-        {context}
-        
-        Question: {question}
-
-        Provide a concise answer. Always give top 3 citations using the format [Source: doc_name, Page: page_number].
-        """
-    )
 
-    context = "\n".join(
-        [
-            f"Document: {doc.metadata['doc_name']}, Page: {doc.metadata['page']}\nContent: {doc.page_content}"
-            for doc in retrieved_docs
-        ]
-    )
+    context = build_context(retrieved_docs)
 
     final_prompt = prompt_template.format(context=context, question=request.query)
-    # Stream the response 
+    # Stream the response
     async def stream_generator():
         for chunk in llm.stream(final_prompt):
             yield chunk.content
-    
-    return StreamingResponse(stream_generator(), media_type="text/event-stream")
\ No newline at end of file
+
+    return StreamingResponse(stream_generator(), media_type="text/event-stream")
+
+
+@router.post("/api/qa/batch", summary="Answer a batch of questions based on documents")
+@log_timing
+async def answer_questions_batch(request: QA_BatchRequest):
+    """
+    Answers many questions against the same scope. The index is loaded once, all
+    queries are embedded and searched in a single batch, and LLM generations run
+    concurrently (bounded by QA_BATCH_MAX_CONCURRENCY). Results are streamed back
+    as NDJSON, one line per question, in completion order.
+    """
+    if not request.questions:
+        return {"answer": "Please provide at least one question."}
+
+    vector_store, error = load_scope_vector_store(request.scope, request.doc_id)
+    if error:
+        return {"answer": error}
+
+    # Top-k retrieval 10, one embedding call and one FAISS search for the whole batch
+    retrieved = await asyncio.to_thread(
+        batch_similarity_search, vector_store, request.questions, 10
+    )
+
+    llm = ChatGoogleGenerativeAI(
+        model="gemini-1.5-flash"
+    )
+    semaphore = asyncio.Semaphore(max(1, settings.QA_BATCH_MAX_CONCURRENCY))
+
+    async def answer_one(index: int, question: str, retrieved_docs):
+        context = build_context(retrieved_docs)
+        final_prompt = prompt_template.format(context=context, question=question)
+        result = {"index": index, "question": question}
+        try:
+            async with semaphore:
+                response = await llm.ainvoke(final_prompt)
+            result["answer"] = response.content
+        except Exception as e:
+            logging.error(f"Batch QA failed for question {index}: {e}")
+            result["error"] = str(e)
+        return result
+
+    # Stream each result as soon as its generation completes
+    async def stream_generator():
+        tasks = [
+            asyncio.create_task(answer_one(i, question, docs))
+            for i, (question, docs) in enumerate(zip(request.questions, retrieved))
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                yield json.dumps(result) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream_generator(), media_type="application/x-ndjson")
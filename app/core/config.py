@@ -5,6 +5,8 @@ class Settings(BaseSettings):
     GOOGLE_API_KEY: str
     UPLOAD_DIR: str = "data/uploads"
     FAISS_INDEX_DIR: str = "data/faiss_index"
+    TEXT_STORE_DIR: str = "data/extracted_text"
+    QA_BATCH_MAX_CONCURRENCY: int = 4
 
     class Config:
         env_file = ".env"
@@ -17,6 +17,7 @@ import asyncio
 from app.core.config import settings
 from app.core.utils import log_timing
 from app.services.database import update_file_status
+from app.services.text_store import save_pages
 from app.services.vector_db import create_and_save_faiss_index
 
 global_doctr_model = None
@@ -40,9 +41,9 @@ def is_text_quality_good(text):
 
     return True
 
-# Extract text from PDF using pdfplumber
+# Extract text from PDF using pdfplumber, one entry per page
 def extract_text_with_pdfplumber(pdf_path):
-    extracted_text = ""
+    extracted_pages = []
     try:
         logging.info(
             f"🔍 Extracting text from PDF with pdfplumber: {os.path.basename(pdf_path)}"
@@ -51,17 +52,18 @@ def extract_text_with_pdfplumber(pdf_path):
             for page_idx, page in enumerate(pdf.pages):
                 page_text = page.extract_text()
                 if page_text and page_text.strip():
-                    extracted_text += page_text.strip() + "\n"
+                    extracted_pages.append(page_text.strip() + "\n")
                 else:
+                    extracted_pages.append("")
                     logging.warning(f"⚠️ Blank or unreadable page: {page_idx + 1}")
     except Exception as e:
         logging.error(
             f"❌ Error with pdfplumber for '{os.path.basename(pdf_path)}': {e}"
         )
-        extracted_text = ""
-    return extracted_text
+        extracted_pages = []
+    return extracted_pages
 
-# Extract text from PDF using DocTR
+# Extract text from PDF using DocTR, one entry per page
 def extract_text_from_pdf_with_doctr(pdf_path):
     global global_doctr_model
     if not global_doctr_model:
@@ -79,22 +81,24 @@ def extract_text_from_pdf_with_doctr(pdf_path):
         all_pages_np = [np.array(img) for img in images_pil]
         result = global_doctr_model(all_pages_np)
 
-        extracted_text = ""
+        extracted_pages = []
         for page in result.pages:
+            page_text = ""
             for block in page.blocks:
                 for line in block.lines:
                     line_text = " ".join([word.value for word in line.words])
-                    extracted_text += line_text + "\n"
-        return extracted_text
+                    page_text += line_text + "\n"
+            extracted_pages.append(page_text)
+        return extracted_pages
 
     except Exception as e:
         logging.error(f"An error occurred during DocTR processing: {e}")
-        return ""
+        return []
 
-# Main extraction function
+# Main extraction function, returns the text of each page
 async def extract_text_from_file(file_path: str):
     file_extension = os.path.splitext(file_path)[1].lower()
-    text_content = ""
+    pages = []
     if file_extension in [".jpg", ".jpeg", ".png"]:
         try:
             image_obj = Image.open(file_path)
@@ -108,14 +112,14 @@ async def extract_text_from_file(file_path: str):
             temp_pdf_path = os.path.join(os.path.dirname(file_path), f"{os.path.splitext(os.path.basename(file_path))[0]}.pdf")
             image.save(temp_pdf_path, "PDF", resolution=100.0)
 
-            pdfplumber_text = extract_text_with_pdfplumber(temp_pdf_path)
+            pdfplumber_pages = extract_text_with_pdfplumber(temp_pdf_path)
             # Check the quality of the extracted text
-            if pdfplumber_text and is_text_quality_good(pdfplumber_text):
-                text_content = pdfplumber_text
+            if pdfplumber_pages and is_text_quality_good("".join(pdfplumber_pages)):
+                pages = pdfplumber_pages
                 logging.info("Image to PDF conversion and PDF Plumber extraction succeeded.")
             else:
                 logging.info("PDF Plumber text quality is poor, falling back to DocTR OCR.")
-                text_content = extract_text_from_pdf_with_doctr(temp_pdf_path)
+                pages = extract_text_from_pdf_with_doctr(temp_pdf_path)
             os.remove(temp_pdf_path) 
 
         except Exception as e:
@@ -123,20 +127,22 @@ async def extract_text_from_file(file_path: str):
             return None
     
     elif file_extension == ".pdf":
-        pdfplumber_text = extract_text_with_pdfplumber(file_path)
+        pdfplumber_pages = extract_text_with_pdfplumber(file_path)
 
-        if pdfplumber_text and is_text_quality_good(pdfplumber_text):
-            text_content = pdfplumber_text
+        if pdfplumber_pages and is_text_quality_good("".join(pdfplumber_pages)):
+            pages = pdfplumber_pages
             logging.info("PDF Plumber extraction succeeded.")
         else:
             logging.info("PDF Plumber text quality is poor, falling back to DocTR OCR.")
-            text_content = extract_text_from_pdf_with_doctr(file_path)
+            pages = extract_text_from_pdf_with_doctr(file_path)
 
     elif file_extension == ".docx":
         try:
             doc = Document(file_path)
+            text_content = ""
             for paragraph in doc.paragraphs:
                 text_content += paragraph.text + "\n"
+            pages = [text_content]
         except Exception as e:
             logging.error(f"Error extracting text from DOCX: {e}")
             return None
@@ -144,7 +150,7 @@ async def extract_text_from_file(file_path: str):
     elif file_extension == ".txt":
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                text_content = f.read()
+                pages = [f.read()]
         except Exception as e:
             logging.error(f"Error reading TXT file: {e}")
             return None
@@ -152,7 +158,7 @@ async def extract_text_from_file(file_path: str):
     else:
         return None
 
-    return text_content
+    return pages
 
 
 @log_timing
@@ -164,18 +170,14 @@ async def process_file_pipeline(file_path: str, file_name: str, file_id: str):
         logging.info(f"Starting extraction for {file_id}")
         await asyncio.sleep(3)# Add a 3-second delay for demonstration
 
-        text_content = await extract_text_from_file(file_path)
+        pages = await extract_text_from_file(file_path)
+        text_content = "".join(pages) if pages else ""
         if not text_content:
             update_file_status(file_id, file_name, "Failed")
             return
-        file_name_without_ext = os.path.splitext(file_name)[0]
-        extracted_text_dir = "extracted_text"
-        os.makedirs(extracted_text_dir, exist_ok=True)
-        text_file_path = os.path.join(extracted_text_dir, f"{file_name_without_ext}.txt")
-        
-        with open(text_file_path, "w", encoding="utf-8") as f:
-            f.write(text_content)
-        logging.info(f"Extracted text saved to {text_file_path}")
+
+        text_store_path = save_pages(file_id, pages)
+        logging.info(f"Extracted text ({len(pages)} pages) saved to {text_store_path}")
         
         
         # Update status before chunking/embedding
@@ -0,0 +1,91 @@
+# app/services/text_store.py
+import mmap
+import os
+import struct
+import zlib
+
+from app.core.config import settings
+
+# File layout: [zlib page blocks][offset index: (n + 1) x uint64][footer]
+# Page i (1-based) lives at bytes offsets[i - 1]:offsets[i].
+MAGIC = b"ADTS"
+FOOTER = struct.Struct("<Q4s")  # page count, magic
+OFFSET = struct.Struct("<Q")
+
+
+def get_text_store_path(file_id: str):
+    return os.path.join(settings.TEXT_STORE_DIR, f"{file_id}.pages")
+
+# function to write the extracted pages of a document
+def save_pages(file_id: str, pages: list[str]):
+    """
+    Writes each page as a separate compressed block followed by an offset index,
+    so any page range can later be read without decompressing the whole document.
+    """
+    os.makedirs(settings.TEXT_STORE_DIR, exist_ok=True)
+    store_path = get_text_store_path(file_id)
+    temp_path = f"{store_path}.tmp"
+
+    offsets = [0]
+    with open(temp_path, "wb") as f:
+        for page in pages:
+            block = zlib.compress(page.encode("utf-8"))
+            f.write(block)
+            offsets.append(offsets[-1] + len(block))
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        f.write(FOOTER.pack(len(pages), MAGIC))
+
+    os.replace(temp_path, store_path)
+    return store_path
+
+# function to get the number of stored pages
+def get_page_count(file_id: str):
+    store_path = get_text_store_path(file_id)
+    if not os.path.exists(store_path):
+        return None
+    with open(store_path, "rb") as f:
+        f.seek(-FOOTER.size, os.SEEK_END)
+        page_count, magic = FOOTER.unpack(f.read(FOOTER.size))
+    if magic != MAGIC:
+        raise ValueError(f"Corrupt text store for {file_id}")
+    return page_count
+
+def _read_page_blocks(mm, file_id: str, start: int, end: int):
+    page_count, magic = FOOTER.unpack_from(mm, len(mm) - FOOTER.size)
+    if magic != MAGIC:
+        raise ValueError(f"Corrupt text store for {file_id}")
+    if start < 1 or end < start or end > page_count:
+        raise IndexError(f"Page range {start}-{end} out of bounds (1-{page_count})")
+
+    index_start = len(mm) - FOOTER.size - OFFSET.size * (page_count + 1)
+    offsets = struct.unpack_from(
+        f"<{end - start + 2}Q", mm, index_start + OFFSET.size * (start - 1)
+    )
+    for i in range(len(offsets) - 1):
+        yield zlib.decompress(mm[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+# function to read a range of pages
+def read_pages(file_id: str, start: int, end: int):
+    """
+    Returns the text of pages start..end (1-based, inclusive).
+    Only the index entries and compressed blocks for the requested pages are touched.
+    """
+    store_path = get_text_store_path(file_id)
+    if not os.path.exists(store_path):
+        return None
+    with open(store_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return list(_read_page_blocks(mm, file_id, start, end))
+
+# function to stream all pages, e.g. for re-chunking without re-extracting
+def iter_pages(file_id: str):
+    page_count = get_page_count(file_id)
+    if not page_count:
+        return
+    with open(get_text_store_path(file_id), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from _read_page_blocks(mm, file_id, 1, page_count)
+
+# function to delete a document's text store
+def delete_pages(file_id: str):
+    store_path = get_text_store_path(file_id)
+    if os.path.exists(store_path):
+        os.remove(store_path)
@@ -1,5 +1,7 @@
 # app/services/vector_db.py
 import os
+import faiss
+import numpy as np
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
@@ -73,3 +75,26 @@ def merge_faiss_indexes(index_dir: str):
             merged_index.merge_from(current_index)
 
     return merged_index
+
+# function to run a batch of queries against a FAISS index in one search
+def batch_similarity_search(vector_store, queries: list[str], k: int = 10):
+    """
+    Embeds all queries in a single call and runs one FAISS search for the batch.
+    Returns a list of retrieved documents for each query, in query order.
+    """
+    query_embeddings = vector_store.embeddings.embed_documents(queries)
+    vectors = np.array(query_embeddings, dtype=np.float32)
+    if vector_store._normalize_L2:
+        faiss.normalize_L2(vectors)
+    _, indices = vector_store.index.search(vectors, k)
+
+    results = []
+    for row in indices:
+        docs = []
+        for i in row:
+            if i == -1:
+                continue
+            doc_id = vector_store.index_to_docstore_id[i]
+            docs.append(vector_store.docstore.search(doc_id))
+        results.append(docs)
+    return results